@@ -1,119 +1,142 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import functools
+import glob
+import gzip
+import hashlib
+import http.client
 import json
 import os
 import re
 import sys
+import threading
+import time
+import zlib
 from pathlib import Path
-from typing import Optional
-from urllib import request, error
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
+from urllib import error, parse, request
+
+try:
+    import h2  # noqa: F401  (required by httpx for HTTP/2)
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 DEFAULT_ENDPOINT = "https://api.linear.app/graphql"
 DEFAULT_CONFIG = ".linear-task-planner.json"
+DEFAULT_CACHE_DIR = "~/.cache/linear-task-planner"
+DEFAULT_CACHE_TTL = 60.0
+GZIP_REQUEST_MIN_BYTES = 1024
+ISSUE_IDENTIFIER_RE = re.compile(r"^([A-Za-z][A-Za-z0-9_]*)-(\d+)$")
+GRAPHQL_IGNORED_RE = re.compile(r'"""[\s\S]*?"""|"(?:\\.|[^"\\\n])*"|#[^\n]*')
+GRAPHQL_NAME_RE = re.compile(r"[_A-Za-z][_0-9A-Za-z]*")
+ENV_VALUE_RE = re.compile(r"""^\s*(?:"(.*)"|'(.*)'|(.*?))\s*$""")
+MAX_CONCURRENCY = 8
+POOL_MAXSIZE = MAX_CONCURRENCY
 
-QUERY_ISSUE_BY_ID = """
-query IssueDetail($issueId: String!, $includeDetails: Boolean = false) {
-  issue(id: $issueId) {
-    id
-    identifier
-    title
-    description
-    url
-    priority
-    dueDate
-    state {
+_SOURCE: dict[str, str] = {}
+
+
+def _minify(query: str, register: bool = False) -> str:
+    minified = re.sub(r"\s+", " ", query).strip()
+    minified = re.sub(r" ?([{}():,=!]) ?", r"\1", minified)
+    # Only import-time constants are recorded, so _SOURCE stays bounded.
+    if register:
+        _SOURCE[minified] = query
+    return minified
+
+
+ISSUE_BASIC_FIELDS = """
+  id
+  identifier
+  title
+  description
+  url
+  priority
+  dueDate
+  state {
+    name
+    type
+  }
+  labels {
+    nodes {
       name
-      type
     }
-    labels {
-      nodes {
+  }
+  assignee {
+    name
+    email
+  }
+  project {
+    name
+    url
+  }
+  updatedAt
+"""
+
+ISSUE_DETAIL_FIELDS = """
+  comments {
+    nodes {
+      id
+      body
+      user {
         name
       }
+      createdAt
     }
-    assignee {
-      name
-      email
-    }
-    project {
-      name
+  }
+  attachments {
+    nodes {
+      id
+      title
       url
+      createdAt
     }
-    updatedAt
-    comments @include(if: $includeDetails) {
-      nodes {
-        id
-        body
-        user {
-          name
-        }
-        createdAt
-      }
-    }
-    attachments @include(if: $includeDetails) {
-      nodes {
-        id
-        title
-        url
-        createdAt
-      }
-    }
+  }
+"""
+
+ISSUE_FRAGMENTS = {
+    "ids-only": "\nfragment IssueFields on Issue {\n  id\n  identifier\n  updatedAt\n}\n",
+    "basic": "\nfragment IssueFields on Issue {" + ISSUE_BASIC_FIELDS + "}\n",
+    "full": "\nfragment IssueFields on Issue {" + ISSUE_BASIC_FIELDS + ISSUE_DETAIL_FIELDS + "}\n",
+}
+
+QUERY_ISSUE_BY_ID_TEMPLATE = """
+query IssueDetail($issueId: String!) {
+  issue(id: $issueId) {
+    ...IssueFields
   }
 }
 """
 
-QUERY_ISSUE_BY_IDENTIFIER = """
-query IssueByIdentifier($teamKey: String!, $number: Float!, $includeDetails: Boolean = false) {
+QUERY_ISSUE_BY_IDENTIFIER_TEMPLATE = """
+query IssueByIdentifier($teamKey: String!, $number: Float!) {
   issues(filter: { number: { eq: $number }, team: { key: { eq: $teamKey } } }) {
     nodes {
-      id
-      identifier
-      title
-      description
-      url
-      priority
-      dueDate
-      state {
-        name
-        type
-      }
-      labels {
-        nodes {
-          name
-        }
-      }
-      assignee {
-        name
-        email
-      }
-      project {
-        name
-        url
-      }
-      updatedAt
-      comments @include(if: $includeDetails) {
-        nodes {
-          id
-          body
-          user {
-            name
-          }
-          createdAt
-        }
-      }
-      attachments @include(if: $includeDetails) {
-        nodes {
-          id
-          title
-          url
-          createdAt
-        }
-      }
+      ...IssueFields
     }
   }
 }
 """
 
-QUERY_PROJECT = """
+QUERY_ISSUE_BY_ID = {
+    fields: _minify(QUERY_ISSUE_BY_ID_TEMPLATE + fragment, register=True)
+    for fields, fragment in ISSUE_FRAGMENTS.items()
+}
+QUERY_ISSUE_BY_IDENTIFIER = {
+    fields: _minify(QUERY_ISSUE_BY_IDENTIFIER_TEMPLATE + fragment, register=True)
+    for fields, fragment in ISSUE_FRAGMENTS.items()
+}
+
+QUERY_PROJECT = _minify(
+    """
 query ProjectDetail($projectId: String!, $first: Int = 50) {
   project(id: $projectId) {
     id
@@ -145,9 +168,12 @@ query ProjectDetail($projectId: String!, $first: Int = 50) {
     }
   }
 }
-"""
+""",
+    register=True,
+)
 
-QUERY_TEAM = """
+QUERY_TEAM = _minify(
+    """
 query TeamIssues($teamId: String!, $first: Int = 50) {
   team(id: $teamId) {
     id
@@ -172,24 +198,130 @@ query TeamIssues($teamId: String!, $first: Int = 50) {
     }
   }
 }
-"""
+""",
+    register=True,
+)
+
+
+QUERY_ISSUE_BY_ID_PROBE = _minify(
+    """
+query IssueDetailProbe($issueId: String!) {
+  issue(id: $issueId) {
+    updatedAt
+  }
+}
+""",
+    register=True,
+)
+
+QUERY_ISSUE_BY_IDENTIFIER_PROBE = _minify(
+    """
+query IssueByIdentifierProbe($teamKey: String!, $number: Float!) {
+  issues(filter: { number: { eq: $number }, team: { key: { eq: $teamKey } } }) {
+    nodes {
+      id
+      updatedAt
+    }
+  }
+}
+""",
+    register=True,
+)
+
+QUERY_PROJECT_PROBE = _minify(
+    """
+query ProjectDetailProbe($projectId: String!) {
+  project(id: $projectId) {
+    updatedAt
+    issues(first: 1, orderBy: updatedAt) {
+      nodes {
+        updatedAt
+      }
+    }
+  }
+}
+""",
+    register=True,
+)
+
+QUERY_TEAM_PROBE = _minify(
+    """
+query TeamIssuesProbe($teamId: String!) {
+  team(id: $teamId) {
+    issues(first: 1, orderBy: updatedAt) {
+      nodes {
+        updatedAt
+      }
+    }
+  }
+}
+""",
+    register=True,
+)
+
+def _first_node(connection: Optional[dict]) -> Optional[dict]:
+    nodes = (connection or {}).get("nodes") or []
+    return nodes[0] if nodes else None
+
+
+# Each extractor reads the same updatedAt values from a probe response and from the full
+# response, so the fingerprint can be stored straight from the full fetch.
+def _issue_fingerprint(data: dict) -> object:
+    return (data.get("issue") or {}).get("updatedAt")
+
+
+def _issues_fingerprint(data: dict) -> object:
+    nodes = (data.get("issues") or {}).get("nodes") or []
+    return [[node.get("id"), node.get("updatedAt")] for node in nodes]
+
+
+def _project_fingerprint(data: dict) -> object:
+    project = data.get("project") or {}
+    return [project.get("updatedAt"), (_first_node(project.get("issues")) or {}).get("updatedAt")]
+
+
+def _team_fingerprint(data: dict) -> object:
+    team = data.get("team") or {}
+    return (_first_node(team.get("issues")) or {}).get("updatedAt")
+
+
+# Maps each full query to a probe selecting only updatedAt, the variables the probe accepts and
+# the extractor that fingerprints either response.
+# The "full" issue projections are excluded: comment and attachment changes do not reliably bump
+# the issue's updatedAt, so they fall back to the plain TTL cache.
+PROBE_QUERIES = {
+    **{
+        query: (QUERY_ISSUE_BY_ID_PROBE, ("issueId",), _issue_fingerprint)
+        for fields, query in QUERY_ISSUE_BY_ID.items()
+        if fields != "full"
+    },
+    **{
+        query: (QUERY_ISSUE_BY_IDENTIFIER_PROBE, ("teamKey", "number"), _issues_fingerprint)
+        for fields, query in QUERY_ISSUE_BY_IDENTIFIER.items()
+        if fields != "full"
+    },
+    QUERY_PROJECT: (QUERY_PROJECT_PROBE, ("projectId",), _project_fingerprint),
+    QUERY_TEAM: (QUERY_TEAM_PROBE, ("teamId",), _team_fingerprint),
+}
+
+
+def unquote_env_value(value: str) -> str:
+    match = ENV_VALUE_RE.match(value)
+    return next(group for group in match.groups() if group is not None)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_env_file(path: str, mtime_ns: int) -> dict:
+    lines = (line.strip() for line in Path(path).read_text().splitlines())
+    lines = (line[len("export ") :].strip() if line.startswith("export ") else line for line in lines)
+    pairs = [line.split("=", 1) for line in lines if line and not line.startswith("#") and "=" in line]
+    return {key.strip(): unquote_env_value(value) for key, value in pairs}
 
 
 def load_env_file(path: Path) -> dict:
-    env = {}
     if not path or not path.exists():
-        return env
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("export "):
-            line = line[len("export ") :].strip()
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        env[key.strip()] = value.strip().strip('"').strip("'")
-    return env
+        return {}
+    return dict(_read_env_file(str(path), path.stat().st_mtime_ns))
 
 
 def resolve_env_path(arg_env: str, config: dict) -> Optional[Path]:
@@ -205,22 +337,28 @@ def resolve_env_path(arg_env: str, config: dict) -> Optional[Path]:
     return None
 
 
+@functools.lru_cache(maxsize=8)
+def _read_config(path: str, mtime_ns: int) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except json.JSONDecodeError:
+        return {}
+
+
 def load_config(path: Path) -> dict:
     if path.exists():
-        try:
-            return json.loads(path.read_text())
-        except json.JSONDecodeError:
-            return {}
+        return dict(_read_config(str(path), path.stat().st_mtime_ns))
     return {}
 
 
 def write_config(path: Path, config: dict) -> None:
     path.write_text(json.dumps(config, indent=2) + "\n")
+    _read_config.cache_clear()
 
 
 def parse_issue_identifier(identifier: str) -> tuple[str, int]:
     value = identifier.strip()
-    match = re.match(r"^([A-Za-z][A-Za-z0-9_]*)-(\d+)$", value)
+    match = ISSUE_IDENTIFIER_RE.match(value)
     if not match:
         raise ValueError(f"Invalid issue identifier '{identifier}'. Expected format TEAM-123.")
     team_key = match.group(1).upper()
@@ -228,6 +366,48 @@ def parse_issue_identifier(identifier: str) -> tuple[str, int]:
     return team_key, number
 
 
+def split_values(values: list[Optional[str]]) -> list[str]:
+    result = []
+    for value in values:
+        if not value:
+            continue
+        for part in value.split(","):
+            part = part.strip()
+            if part and part not in result:
+                result.append(part)
+    return result
+
+
+def parse_issue_identifiers(values: list[str]) -> list[str]:
+    return split_values([value.upper() for value in values])
+
+
+def build_issues_batch(identifiers: list[str], fields: str) -> tuple[str, dict]:
+    definitions = []
+    selections = []
+    variables = {}
+    for index, identifier in enumerate(identifiers):
+        team_key, number = parse_issue_identifier(identifier)
+        definitions.append(f"$teamKey{index}: String!, $number{index}: Float!")
+        selections.append(
+            f"  i{index}: issues(filter: {{ number: {{ eq: $number{index} }}, "
+            f"team: {{ key: {{ eq: $teamKey{index} }} }} }}) {{\n"
+            "    nodes {\n"
+            "      ...IssueFields\n"
+            "    }\n"
+            "  }"
+        )
+        variables[f"teamKey{index}"] = team_key
+        variables[f"number{index}"] = float(number)
+    query = (
+        f"\nquery IssuesByIdentifier({', '.join(definitions)}) {{\n"
+        + "\n".join(selections)
+        + "\n}\n"
+        + ISSUE_FRAGMENTS[fields]
+    )
+    return _minify(query), variables
+
+
 def format_auth_header(token: str, scheme: Optional[str]) -> str:
     if scheme:
         scheme_value = scheme.strip().lower()
@@ -244,27 +424,463 @@ def format_auth_header(token: str, scheme: Optional[str]) -> str:
     return token
 
 
+def dumps_json(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(body: bytes):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+@functools.lru_cache(maxsize=32)
+def encode_query(query: str) -> bytes:
+    return dumps_json(query)
+
+
+@functools.lru_cache(maxsize=32)
+def query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def build_payload(query: Optional[str], variables: dict, extensions: Optional[dict] = None) -> bytes:
+    fields = []
+    if query is not None:
+        fields.append(b'"query":' + encode_query(query))
+    fields.append(b'"variables":' + dumps_json(variables))
+    if extensions:
+        fields.append(b'"extensions":' + dumps_json(extensions))
+    return b"{" + b",".join(fields) + b"}"
+
+
+def decode_body(raw: bytes, content_encoding: Optional[str]) -> bytes:
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(raw)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    return raw
+
+
+def env_flag(name: str) -> bool:
+    return os.environ.get(name, "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+_POOL_LOCK = threading.Lock()
+_IDLE_CONNECTIONS: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+_HTTP2_CLIENT = None
+
+
+def get_http2_client():
+    global _HTTP2_CLIENT
+    if httpx is None or not env_flag("LINEAR_FETCH_HTTP2"):
+        return None
+    with _POOL_LOCK:
+        if _HTTP2_CLIENT is None:
+            _HTTP2_CLIENT = httpx.Client(
+                http2=True,
+                timeout=None,
+                limits=httpx.Limits(max_connections=MAX_CONCURRENCY),
+            )
+        return _HTTP2_CLIENT
+
+
+def acquire_connection(endpoint: str) -> tuple[http.client.HTTPConnection, bool]:
+    parts = parse.urlsplit(endpoint)
+    key = (parts.scheme, parts.netloc)
+    with _POOL_LOCK:
+        idle = _IDLE_CONNECTIONS.get(key)
+        if idle:
+            return idle.pop(), True
+    if parts.scheme == "https":
+        return http.client.HTTPSConnection(parts.netloc), False
+    if parts.scheme == "http":
+        return http.client.HTTPConnection(parts.netloc), False
+    raise RuntimeError(f"Unsupported endpoint scheme: {endpoint}")
+
+
+def release_connection(endpoint: str, conn: http.client.HTTPConnection) -> None:
+    parts = parse.urlsplit(endpoint)
+    key = (parts.scheme, parts.netloc)
+    with _POOL_LOCK:
+        idle = _IDLE_CONNECTIONS.setdefault(key, [])
+        if len(idle) < POOL_MAXSIZE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def close_connections() -> None:
+    global _HTTP2_CLIENT
+    with _POOL_LOCK:
+        if _HTTP2_CLIENT is not None:
+            _HTTP2_CLIENT.close()
+            _HTTP2_CLIENT = None
+        for idle in _IDLE_CONNECTIONS.values():
+            for conn in idle:
+                conn.close()
+        _IDLE_CONNECTIONS.clear()
+
+
+def uses_proxy(endpoint: str) -> bool:
+    parts = parse.urlsplit(endpoint)
+    proxy = request.getproxies().get(parts.scheme)
+    return bool(proxy) and not request.proxy_bypass(parts.hostname or "")
+
+
+def send_via_urlopen(
+    endpoint: str, payload: bytes, headers: Mapping[str, str]
+) -> tuple[int, bytes, Optional[str]]:
+    req = request.Request(endpoint, data=payload, headers=dict(headers), method="POST")
+    try:
+        with request.urlopen(req) as resp:
+            return resp.status, resp.read(), resp.headers.get("Content-Encoding")
+    except error.HTTPError as exc:
+        raw = exc.read() if exc.fp else b""
+        return exc.code, raw, exc.headers.get("Content-Encoding")
+
+
+def send_request(
+    endpoint: str, payload: bytes, headers: Mapping[str, str], idempotent: bool = False
+) -> tuple[int, bytes, Optional[str]]:
+    client = get_http2_client()
+    if client is not None:
+        resp = client.post(endpoint, content=payload, headers=headers)
+        # httpx already decodes Content-Encoding on resp.content.
+        return resp.status_code, resp.content, None
+    if uses_proxy(endpoint):
+        # urlopen handles http_proxy/https_proxy/no_proxy (including proxy auth and CONNECT).
+        return send_via_urlopen(endpoint, payload, headers)
+    parts = parse.urlsplit(endpoint)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    while True:
+        conn, reused = acquire_connection(endpoint)
+        try:
+            conn.request("POST", path, body=payload, headers=headers)
+        except (http.client.HTTPException, ConnectionError):
+            conn.close()
+            # A pooled connection may have been closed by the server while idle.
+            # The request was not fully sent, so it is safe to retry on a new one.
+            if reused:
+                continue
+            raise
+        try:
+            resp = conn.getresponse()
+            raw = resp.read()
+        except (http.client.HTTPException, ConnectionError):
+            conn.close()
+            # The server may already have executed the request, so only re-send reads.
+            if reused and idempotent:
+                continue
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            release_connection(endpoint, conn)
+        return resp.status, raw, resp.getheader("Content-Encoding")
+
+
+def is_mutation(query: str) -> bool:
+    # Check the keyword opening every top-level definition, skipping strings and comments.
+    text = GRAPHQL_IGNORED_RE.sub(" ", query)
+    depth = 0
+    header = []
+    for char in text:
+        if char == "{" and depth == 0:
+            keyword = GRAPHQL_NAME_RE.search("".join(header))
+            if keyword and keyword.group() == "mutation":
+                return True
+            header = []
+        if char in "{(":
+            depth += 1
+        elif char in "})":
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            header.append(char)
+    return False
+
+
+def cache_path(
+    cache_dir: Path, endpoint: str, query: str, variables: dict, headers: Mapping[str, str]
+) -> Path:
+    digest = hashlib.blake2b(digest_size=20)
+    for part in (
+        endpoint,
+        query,
+        json.dumps(variables, sort_keys=True),
+        headers.get("Authorization", ""),
+        json.dumps({k: v for k, v in headers.items() if k != "Authorization"}, sort_keys=True),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return cache_dir / f"{digest.hexdigest()}.json.gz"
+
+
+def read_cache(path: Path, ttl: float) -> Optional[dict]:
+    try:
+        if path.stat().st_mtime <= time.time() - ttl:
+            return None
+        return loads_json(gzip.decompress(path.read_bytes()))
+    except (OSError, EOFError, ValueError):
+        return None
+
+
+def write_cache(path: Path, data: bytes) -> None:
+    # Cached responses hold private workspace data, so keep them readable by the owner only.
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def meta_path(path: Path) -> Path:
+    return path.with_name(path.name.replace(".json.gz", ".meta"))
+
+
+def compute_fingerprint(fingerprint_of, response: dict) -> bytes:
+    return json.dumps(fingerprint_of(response.get("data") or {}), sort_keys=True).encode("utf-8")
+
+
+def revalidate_cache(path: Path, fingerprint: bytes) -> Optional[dict]:
+    try:
+        if meta_path(path).read_bytes() != fingerprint:
+            return None
+        os.utime(path)
+    except OSError:
+        return None
+    return read_cache(path, float("inf"))
+
+
+PROBE_ERRORS = (RuntimeError, OSError, ValueError, http.client.HTTPException) + (
+    (httpx.HTTPError,) if httpx is not None else ()
+)
+_APQ_UNSUPPORTED: set[str] = set()
+APQ_MISSING_QUERY_RE = re.compile(
+    r"must (?:provide|contain)[^\"]*query|query[^\"]*(?:missing|required)", re.IGNORECASE
+)
+
+
+def persisted_query_failed(endpoint: str, status: int, body: bytes) -> bool:
+    # True only when the server did not execute the hash-only request; any other
+    # result (including execution errors) has already run and must not be re-sent.
+    try:
+        response = loads_json(body)
+    except ValueError:
+        response = {}
+    errors = (response.get("errors") if isinstance(response, dict) else None) or []
+    for item in errors:
+        code = (item.get("extensions") or {}).get("code")
+        message = item.get("message")
+        if code == "PERSISTED_QUERY_NOT_FOUND" or message == "PersistedQueryNotFound":
+            return True
+        if code == "PERSISTED_QUERY_NOT_SUPPORTED" or message == "PersistedQueryNotSupported":
+            _APQ_UNSUPPORTED.add(endpoint)
+            return True
+    if status == 400 and APQ_MISSING_QUERY_RE.search(body.decode("utf-8", "replace")):
+        # Servers without APQ reject a request that has no query text.
+        _APQ_UNSUPPORTED.add(endpoint)
+        return True
+    return False
+
+
+def send_graphql(
+    endpoint: str, payload: bytes, headers: Mapping[str, str], idempotent: bool = False
+) -> tuple[int, bytes]:
+    headers = dict(headers)
+    if len(payload) > GZIP_REQUEST_MIN_BYTES and env_flag("LINEAR_FETCH_GZIP_REQUEST"):
+        payload = gzip.compress(payload, compresslevel=6)
+        headers["Content-Encoding"] = "gzip"
+    status, raw, content_encoding = send_request(endpoint, payload, headers, idempotent)
+    return status, decode_body(raw, content_encoding)
+
+
 def post_graphql(
     endpoint: str,
-    token: str,
-    auth_scheme: Optional[str],
+    headers: Mapping[str, str],
     query: str,
     variables: dict,
-    extra_headers: dict,
+    cache_dir: Optional[Path] = None,
+    cache_ttl: float = 0,
+    persisted_queries: bool = False,
+    if_modified_since: bool = False,
+    raise_errors: bool = True,
 ) -> dict:
-    payload = json.dumps({"query": query, "variables": variables}).encode("utf-8")
-    req = request.Request(endpoint, data=payload, method="POST")
-    req.add_header("Content-Type", "application/json")
-    req.add_header("Authorization", format_auth_header(token, auth_scheme))
-    for key, value in extra_headers.items():
-        req.add_header(key, value)
-    try:
-        with request.urlopen(req) as resp:
-            body = resp.read().decode("utf-8")
-            return json.loads(body)
-    except error.HTTPError as exc:
-        error_body = exc.read().decode("utf-8") if exc.fp else ""
-        raise RuntimeError(f"Request failed: HTTP {exc.code} {error_body}")
+    idempotent = not is_mutation(query)
+    cached_path = None
+    if cache_dir and (cache_ttl > 0 or if_modified_since) and idempotent:
+        cached_path = cache_path(cache_dir, endpoint, query, variables, headers)
+        cached = read_cache(cached_path, cache_ttl)
+        if cached is not None:
+            return cached
+    probe = PROBE_QUERIES.get(query) if cached_path and if_modified_since else None
+    if probe is not None and cached_path.exists():
+        probe_query, probe_names, fingerprint_of = probe
+        probe_variables = {name: variables[name] for name in probe_names if name in variables}
+        try:
+            probe_response = post_graphql(
+                endpoint,
+                headers,
+                probe_query,
+                probe_variables,
+                persisted_queries=persisted_queries,
+            )
+        except PROBE_ERRORS:
+            # A failed probe only costs the revalidation; fall through to the full fetch.
+            pass
+        else:
+            current = compute_fingerprint(fingerprint_of, probe_response)
+            cached = revalidate_cache(cached_path, current)
+            if cached is not None:
+                return cached
+    extensions = None
+    body = None
+    if persisted_queries and endpoint not in _APQ_UNSUPPORTED:
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash(query)}}
+        status, body = send_graphql(
+            endpoint, build_payload(None, variables, extensions), headers, idempotent
+        )
+        if persisted_query_failed(endpoint, status, body):
+            body = None
+    if body is None:
+        if endpoint in _APQ_UNSUPPORTED:
+            extensions = None
+        status, body = send_graphql(
+            endpoint, build_payload(query, variables, extensions), headers, idempotent
+        )
+    if status >= 400:
+        raise RuntimeError(f"Request failed: HTTP {status} {body.decode('utf-8', 'replace')}")
+    response = loads_json(body)
+    errors = response.get("errors")
+    if errors:
+        if raise_errors:
+            message = "; ".join(item.get("message", "Unknown error") for item in errors)
+            raise RuntimeError(f"GraphQL error: {message}")
+        return response
+    if cached_path:
+        write_cache(cached_path, gzip.compress(body))
+        if probe is not None:
+            write_cache(meta_path(cached_path), compute_fingerprint(probe[2], response))
+    return response
+
+
+async def post_graphql_async(
+    semaphore: asyncio.Semaphore,
+    endpoint: str,
+    headers: Mapping[str, str],
+    query: str,
+    variables: dict,
+    cache_dir: Optional[Path] = None,
+    cache_ttl: float = 0,
+    persisted_queries: bool = False,
+    if_modified_since: bool = False,
+) -> dict:
+    async with semaphore:
+        return await asyncio.to_thread(
+            post_graphql,
+            endpoint,
+            headers,
+            query,
+            variables,
+            cache_dir,
+            cache_ttl,
+            persisted_queries,
+            if_modified_since,
+        )
+
+
+async def gather_graphql(
+    endpoint: str,
+    headers: Mapping[str, str],
+    operations: list[tuple[str, dict]],
+    cache_dir: Optional[Path] = None,
+    cache_ttl: float = 0,
+    persisted_queries: bool = False,
+    if_modified_since: bool = False,
+) -> list[dict]:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    return await asyncio.gather(
+        *(
+            post_graphql_async(
+                semaphore,
+                endpoint,
+                headers,
+                query,
+                variables,
+                cache_dir,
+                cache_ttl,
+                persisted_queries,
+                if_modified_since,
+            )
+            for query, variables in operations
+        )
+    )
+
+
+def fetch_many(
+    endpoint: str,
+    headers: Mapping[str, str],
+    operations: list[tuple[str, dict]],
+    cache_dir: Optional[Path] = None,
+    cache_ttl: float = 0,
+    persisted_queries: bool = False,
+    if_modified_since: bool = False,
+) -> list[dict]:
+    if len(operations) == 1:
+        query, variables = operations[0]
+        return [
+            post_graphql(
+                endpoint,
+                headers,
+                query,
+                variables,
+                cache_dir,
+                cache_ttl,
+                persisted_queries,
+                if_modified_since,
+            )
+        ]
+    return asyncio.run(
+        gather_graphql(
+            endpoint,
+            headers,
+            operations,
+            cache_dir,
+            cache_ttl,
+            persisted_queries,
+            if_modified_since,
+        )
+    )
+
+
+def build_headers(token: str, auth_scheme: Optional[str], extra_headers: dict) -> Mapping[str, str]:
+    headers = {
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Authorization": format_auth_header(token, auth_scheme),
+    }
+    headers.update(extra_headers)
+    return MappingProxyType(headers)
+
+
+def resolve_issue_fields(parser: argparse.ArgumentParser, args) -> str:
+    if args.fields:
+        if args.details and args.fields != "full":
+            parser.error(f"{args.command} --details cannot be combined with --fields {args.fields}")
+        return args.fields
+    return "full" if args.details else "basic"
 
 
 def resolve_token(args, env_data: dict) -> Optional[str]:
@@ -275,23 +891,29 @@ def resolve_token(args, env_data: dict) -> Optional[str]:
     return env_data.get("LINEAR_API_TOKEN")
 
 
-def write_output(data: dict, out_path: Optional[str]) -> None:
-    output = json.dumps(data, indent=2)
+def dump_output(data: Union[dict, list], stream) -> None:
+    if orjson is not None:
+        output = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        output = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    buffer = getattr(stream, "buffer", None)
+    if buffer is not None:
+        buffer.write(output)
+    else:
+        stream.write(output.decode("utf-8"))
+
+
+def write_output(data: Union[dict, list], out_path: Optional[str]) -> None:
     if not out_path or out_path == "-":
-        print(output)
+        sys.stdout.flush()
+        dump_output(data, sys.stdout)
+        sys.stdout.flush()
         return
     path = Path(out_path)
     if path.parent and not path.parent.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(output + "\n")
-
-
-def raise_on_errors(response: dict) -> None:
-    errors = response.get("errors")
-    if not errors:
-        return
-    message = "; ".join(error.get("message", "Unknown error") for error in errors)
-    raise RuntimeError(f"GraphQL error: {message}")
+    with path.open("w", encoding="utf-8") as handle:
+        dump_output(data, handle)
 
 
 def parse_variables(value: Optional[str]) -> dict:
@@ -306,7 +928,7 @@ def parse_variables(value: Optional[str]) -> dict:
     return json.loads(value)
 
 
-def main() -> None:
+def main(argv: Optional[list[str]] = None) -> None:
     parser = argparse.ArgumentParser(description="Fetch Linear data for task planning.")
     parser.add_argument("--endpoint", default=DEFAULT_ENDPOINT)
     parser.add_argument("--token", help="Override LINEAR_API_TOKEN")
@@ -321,6 +943,28 @@ def main() -> None:
         dest="public_file_urls_expire_in",
         help="Seconds for signed attachment URLs",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached query responses (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help=f"Seconds a cached response stays fresh (default: {DEFAULT_CACHE_TTL:g})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    parser.add_argument(
+        "--persisted-queries",
+        action="store_true",
+        help="Send query hashes first (Automatic Persisted Queries), falling back to full text",
+    )
+    parser.add_argument(
+        "--if-modified-since",
+        action="store_true",
+        help="Revalidate stale cached responses with a lightweight updatedAt probe",
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -353,10 +997,19 @@ def main() -> None:
         help="Auth scheme override: raw (personal key) or bearer (OAuth)",
     )
     issue_parser.add_argument("--details", action="store_true", help="Include comments/attachments")
+    issue_parser.add_argument(
+        "--fields",
+        choices=sorted(ISSUE_FRAGMENTS),
+        help="Issue projection (default: basic, or full with --details)",
+    )
     issue_parser.add_argument("--out", help="Output path (default: stdout)")
 
     project_parser = subparsers.add_parser("project", help="Fetch project detail and issues")
-    project_parser.add_argument("--id", help="Project id (defaults to config projectId)")
+    project_parser.add_argument(
+        "--id",
+        action="append",
+        help="Project id (defaults to config projectId); repeat or comma-separate to fetch concurrently",
+    )
     project_parser.add_argument("--env", help="Path to env file containing LINEAR_API_TOKEN")
     project_parser.add_argument(
         "--auth-scheme",
@@ -366,7 +1019,11 @@ def main() -> None:
     project_parser.add_argument("--out", help="Output path (default: stdout)")
 
     team_parser = subparsers.add_parser("team", help="Fetch team issues")
-    team_parser.add_argument("--id", help="Team id (defaults to config teamId)")
+    team_parser.add_argument(
+        "--id",
+        action="append",
+        help="Team id (defaults to config teamId); repeat or comma-separate to fetch concurrently",
+    )
     team_parser.add_argument("--env", help="Path to env file containing LINEAR_API_TOKEN")
     team_parser.add_argument(
         "--auth-scheme",
@@ -375,9 +1032,39 @@ def main() -> None:
     team_parser.add_argument("--first", type=int, default=50, help="Number of issues to fetch")
     team_parser.add_argument("--out", help="Output path (default: stdout)")
 
+    issues_parser = subparsers.add_parser("issues", help="Fetch several issues in one request")
+    issues_parser.add_argument(
+        "--identifier",
+        action="append",
+        required=True,
+        help="Issue identifier (e.g., ENG-123); repeat or comma-separate",
+    )
+    issues_parser.add_argument("--env", help="Path to env file containing LINEAR_API_TOKEN")
+    issues_parser.add_argument(
+        "--auth-scheme",
+        help="Auth scheme override: raw (personal key) or bearer (OAuth)",
+    )
+    issues_parser.add_argument("--details", action="store_true", help="Include comments/attachments")
+    issues_parser.add_argument(
+        "--fields",
+        choices=sorted(ISSUE_FRAGMENTS),
+        help="Issue projection (default: basic, or full with --details)",
+    )
+    issues_parser.add_argument("--out", help="Output path (default: stdout)")
+
     custom_parser = subparsers.add_parser("custom", help="Run a custom GraphQL query")
-    custom_parser.add_argument("--query", required=True, help="Path to .graphql file")
+    custom_query_group = custom_parser.add_mutually_exclusive_group(required=True)
+    custom_query_group.add_argument("--query", help="Path to .graphql file")
+    custom_query_group.add_argument(
+        "--query-glob",
+        help="Glob of .graphql files to run concurrently (e.g., 'queries/*.graphql')",
+    )
     custom_parser.add_argument("--variables", help="JSON string, @file, or path")
+    custom_parser.add_argument(
+        "--variables-dir",
+        help="Directory of <query-stem>.json variables files (with --query-glob)",
+    )
+    custom_parser.add_argument("--out-dir", help="Directory for <query-stem>.json outputs (with --query-glob)")
     custom_parser.add_argument("--env", help="Path to env file containing LINEAR_API_TOKEN")
     custom_parser.add_argument(
         "--auth-scheme",
@@ -385,7 +1072,7 @@ def main() -> None:
     )
     custom_parser.add_argument("--out", help="Output path (default: stdout)")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     config_path = Path(args.config)
     config = load_config(config_path)
@@ -423,24 +1110,33 @@ def main() -> None:
     extra_headers = {}
     if args.public_file_urls_expire_in:
         extra_headers["public-file-urls-expire-in"] = str(args.public_file_urls_expire_in)
+    headers = build_headers(token, args.auth_scheme or config.get("authScheme"), extra_headers)
+
+    cache_dir = None if args.no_cache else Path(args.cache_dir).expanduser()
 
     if args.command == "issue":
         if not args.id and not args.identifier:
             parser.error("issue requires --id or --identifier")
         if args.id:
-            query = QUERY_ISSUE_BY_ID
-            variables = {"issueId": args.id, "includeDetails": args.details}
+            query = QUERY_ISSUE_BY_ID[resolve_issue_fields(parser, args)]
+            variables = {"issueId": args.id}
         else:
-            query = QUERY_ISSUE_BY_IDENTIFIER
+            query = QUERY_ISSUE_BY_IDENTIFIER[resolve_issue_fields(parser, args)]
             team_key, number = parse_issue_identifier(args.identifier)
             variables = {
                 "teamKey": team_key,
                 "number": float(number),
-                "includeDetails": args.details,
             }
-        auth_scheme = args.auth_scheme or config.get("authScheme")
-        response = post_graphql(args.endpoint, token, auth_scheme, query, variables, extra_headers)
-        raise_on_errors(response)
+        response = post_graphql(
+            args.endpoint,
+            headers,
+            query,
+            variables,
+            cache_dir,
+            args.cache_ttl,
+            args.persisted_queries,
+            args.if_modified_since,
+        )
         if args.identifier:
             nodes = response.get("data", {}).get("issues", {}).get("nodes", [])
             if len(nodes) == 0:
@@ -454,37 +1150,126 @@ def main() -> None:
         write_output(response, args.out)
         return
 
+    if args.command == "issues":
+        identifiers = parse_issue_identifiers(args.identifier)
+        if not identifiers:
+            parser.error("issues requires at least one --identifier")
+        query, variables = build_issues_batch(identifiers, resolve_issue_fields(parser, args))
+        response = post_graphql(
+            args.endpoint,
+            headers,
+            query,
+            variables,
+            cache_dir,
+            args.cache_ttl,
+            args.persisted_queries,
+            args.if_modified_since,
+        )
+        data = response.get("data") or {}
+        results = []
+        for index, identifier in enumerate(identifiers):
+            nodes = (data.get(f"i{index}") or {}).get("nodes", [])
+            if len(nodes) == 0:
+                raise RuntimeError(f"No issue found for identifier {identifier}")
+            if len(nodes) > 1:
+                matches = ", ".join(node.get("identifier", "?") for node in nodes)
+                raise RuntimeError(
+                    f"Multiple issues matched identifier {identifier}. Use --id instead. "
+                    f"Matches: {matches}"
+                )
+            results.append({"data": {"issues": {"nodes": nodes}}})
+        write_output(results, args.out)
+        return
+
     if args.command == "project":
-        project_id = args.id or config.get("projectId")
-        if not project_id:
+        project_ids = split_values(args.id or [config.get("projectId")])
+        if not project_ids:
             parser.error("project requires --id or config projectId")
-        variables = {"projectId": project_id, "first": args.first}
-        auth_scheme = args.auth_scheme or config.get("authScheme")
-        response = post_graphql(args.endpoint, token, auth_scheme, QUERY_PROJECT, variables, extra_headers)
-        raise_on_errors(response)
-        write_output(response, args.out)
+        operations = [
+            (QUERY_PROJECT, {"projectId": project_id, "first": args.first}) for project_id in project_ids
+        ]
+        responses = fetch_many(
+            args.endpoint,
+            headers,
+            operations,
+            cache_dir,
+            args.cache_ttl,
+            args.persisted_queries,
+            args.if_modified_since,
+        )
+        write_output(responses if len(responses) > 1 else responses[0], args.out)
         return
 
     if args.command == "team":
-        team_id = args.id or config.get("teamId")
-        if not team_id:
+        team_ids = split_values(args.id or [config.get("teamId")])
+        if not team_ids:
             parser.error("team requires --id or config teamId")
-        variables = {"teamId": team_id, "first": args.first}
-        auth_scheme = args.auth_scheme or config.get("authScheme")
-        response = post_graphql(args.endpoint, token, auth_scheme, QUERY_TEAM, variables, extra_headers)
-        raise_on_errors(response)
-        write_output(response, args.out)
+        operations = [(QUERY_TEAM, {"teamId": team_id, "first": args.first}) for team_id in team_ids]
+        responses = fetch_many(
+            args.endpoint,
+            headers,
+            operations,
+            cache_dir,
+            args.cache_ttl,
+            args.persisted_queries,
+            args.if_modified_since,
+        )
+        write_output(responses if len(responses) > 1 else responses[0], args.out)
+        return
+
+    if args.command == "custom" and args.query_glob:
+        if not args.out_dir:
+            parser.error("custom --query-glob requires --out-dir")
+        if args.out:
+            parser.error("custom --query-glob writes to --out-dir; --out is not supported")
+        query_paths = [Path(match) for match in sorted(glob.glob(args.query_glob))]
+        if not query_paths:
+            raise RuntimeError(f"No query files matched: {args.query_glob}")
+        stems = [query_path.stem for query_path in query_paths]
+        duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+        if duplicates:
+            raise RuntimeError(f"Query files share output names: {', '.join(duplicates)}")
+        shared_variables = parse_variables(args.variables)
+        operations = []
+        for query_path in query_paths:
+            variables = shared_variables
+            if args.variables_dir:
+                variables_path = Path(args.variables_dir) / f"{query_path.stem}.json"
+                if variables_path.exists():
+                    variables = json.loads(variables_path.read_text())
+            operations.append((query_path.read_text(), variables))
+        responses = fetch_many(
+            args.endpoint,
+            headers,
+            operations,
+            cache_dir,
+            args.cache_ttl,
+            args.persisted_queries,
+            args.if_modified_since,
+        )
+        for query_path, response in zip(query_paths, responses):
+            write_output(response, str(Path(args.out_dir) / f"{query_path.stem}.json"))
+        print(f"Saved {len(responses)} responses to {args.out_dir}")
         return
 
     if args.command == "custom":
+        if args.out_dir or args.variables_dir:
+            parser.error("custom --out-dir and --variables-dir require --query-glob")
         query_path = Path(args.query)
         if not query_path.exists():
             raise RuntimeError(f"Query file not found: {query_path}")
         query = query_path.read_text()
         variables = parse_variables(args.variables)
-        auth_scheme = args.auth_scheme or config.get("authScheme")
-        response = post_graphql(args.endpoint, token, auth_scheme, query, variables, extra_headers)
-        raise_on_errors(response)
+        response = post_graphql(
+            args.endpoint,
+            headers,
+            query,
+            variables,
+            cache_dir,
+            args.cache_ttl,
+            args.persisted_queries,
+            args.if_modified_since,
+        )
         write_output(response, args.out)
         return
 
@@ -495,3 +1280,5 @@ if __name__ == "__main__":
     except Exception as exc:
         print(f"Error: {exc}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        close_connections()